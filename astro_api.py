@@ -1,21 +1,36 @@
-from flask import Flask, request, abort, Blueprint, jsonify
-from bs4 import BeautifulSoup
+from flask import Flask, Response, request, abort, Blueprint, jsonify
+from flask.json.provider import DefaultJSONProvider
+from lxml import html as lxml_html
+from lxml.etree import XPath
 import requests
+import httpx
+import asyncio
+from requests.adapters import HTTPAdapter, Retry
 import os
 import json
-from datetime import datetime
+import tempfile
+import msgpack
+import orjson
+from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 import time
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Import OpenCC for Chinese conversion
+# Import OpenCC for Chinese conversion, preferring the Rust (PyO3) build
 try:
-    from opencc import OpenCC
+    from opencc_pyo3 import OpenCC
     OPENCC_AVAILABLE = True
+    OPENCC_CONVERT_KWARGS = {'punctuation': False}
 except ImportError:
-    OPENCC_AVAILABLE = False
-    logging.warning("OpenCC not available. Chinese conversion will not work.")
+    try:
+        from opencc import OpenCC
+        OPENCC_AVAILABLE = True
+        OPENCC_CONVERT_KWARGS = {}
+    except ImportError:
+        OPENCC_AVAILABLE = False
+        logging.warning("OpenCC not available. Chinese conversion will not work.")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -23,9 +38,57 @@ logger = logging.getLogger(__name__)
 
 # Cache storage
 CACHE_DIR = os.path.dirname(os.path.abspath(__file__))
-CACHE_FILE = os.path.join(CACHE_DIR, "astro_cache.json")
+CACHE_FILE = os.path.join(CACHE_DIR, "astro_cache.msgpack")
+# JSON cache written by older versions, migrated on the next save
+LEGACY_CACHE_FILE = os.path.join(CACHE_DIR, "astro_cache.json")
 cache = {}
-scheduler = None
+cache_lock = threading.Lock()
+# Pending scheduler timers by job name
+_timers = {}
+
+# Last bytes written to CACHE_FILE, used to skip no-op saves
+_last_saved_blob = None
+# Request handlers save at most once per this many seconds
+SAVE_DEBOUNCE_SECONDS = 5
+_last_save_ts = 0.0
+# Deferred save started by save_cache_debounced, kept apart from the scheduler
+# timers so setup_scheduler cannot cancel it. _save_pending is True only while
+# that timer is still waiting, i.e. before it starts packing the cache.
+_save_timer = None
+_save_pending = False
+_save_timer_lock = threading.Lock()
+
+# Pre-rendered /astro_api responses, indexed by sign:
+# {"date": str, "plain": Response, "simp": Response}, or None until the sign is
+# fetched. A slot whose date is not today counts as a miss.
+# The Response objects are shared between requests and must not be mutated.
+_resp_cache = [None] * 12
+# Today's date string and the timestamp of the next local midnight, when it expires
+_today_str = ""
+_today_expires = 0.0
+
+# Source page for a single astrology sign
+SOURCE_URL = 'http://astro.click108.com.tw/daily_{num}.php?iAstro={num}'
+
+# Selectors for the daily reading, compiled once at import time. They match
+# "div.TODAY_CONTENT > h3" and "div.TODAY_CONTENT > p".
+_TODAY_CONTENT = 'div[contains(concat(" ", normalize-space(@class), " "), " TODAY_CONTENT ")]'
+_XPATH_TITLE = XPath(f'//{_TODAY_CONTENT}/h3')
+_XPATH_ITEMS = XPath(f'//{_TODAY_CONTENT}/p')
+
+# Number of signs fetched concurrently by fetch_all_astro_data
+FETCH_WORKERS = 6
+
+# Shared HTTP session so consecutive fetches reuse keep-alive connections
+REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
 
 # Initialize Chinese converter
 t2s_converter = None
@@ -37,39 +100,126 @@ if OPENCC_AVAILABLE:
         logger.error(f"Error initializing OpenCC: {e}")
         OPENCC_AVAILABLE = False
 
+@lru_cache(maxsize=256)
 def convert_to_simplified(text):
     """Convert traditional Chinese text to simplified Chinese"""
     if OPENCC_AVAILABLE and t2s_converter:
-        return t2s_converter.convert(text)
+        return t2s_converter.convert(text, **OPENCC_CONVERT_KWARGS)
     return text  # Return original if conversion not available
 
+def _today():
+    """Return today's date string, formatting it only when the day rolls over"""
+    global _today_str, _today_expires
+    if time.time() >= _today_expires:
+        now = datetime.now()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        _today_str = now.strftime("%Y-%m-%d")
+        _today_expires = midnight.timestamp()
+    return _today_str
+
+def _build_responses(entry):
+    """Render the traditional and simplified HTML responses for a cache entry"""
+    html = entry["html"]
+    # Entries loaded from an older cache file have no precomputed simplified version
+    html_s = entry.get("html_s") or convert_to_simplified(html)
+    return {
+        "date": entry.get("date"),
+        "plain": Response(html.encode("utf-8"), mimetype="text/html"),
+        "simp": Response(html_s.encode("utf-8"), mimetype="text/html")
+    }
+
+def _prebuild(num, entry):
+    """Publish pre-rendered responses for a sign so requests can return them as-is"""
+    _resp_cache[num] = _build_responses(entry)
+
+def _clear_responses():
+    """Drop all pre-rendered responses, e.g. when the day rolls over"""
+    for num in range(len(_resp_cache)):
+        _resp_cache[num] = None
+
+def _midnight_rollover():
+    """Free yesterday's responses and memoized conversions"""
+    _clear_responses()
+    convert_to_simplified.cache_clear()
+
 def load_cache():
     """Load cache from file if exists"""
     global cache
     try:
         if os.path.exists(CACHE_FILE):
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            with open(CACHE_FILE, 'rb') as f:
+                cache = msgpack.unpackb(f.read(), raw=False)
+        elif os.path.exists(LEGACY_CACHE_FILE):
+            with open(LEGACY_CACHE_FILE, 'r', encoding='utf-8') as f:
                 cache = json.load(f)
-            logger.info("Cache loaded successfully")
+        else:
+            return
+        _clear_responses()
+        for key, entry in cache.items():
+            # Outdated entries are only served as a fallback when fetching fails
+            if is_cache_valid(int(key)):
+                _prebuild(int(key), entry)
+        logger.info("Cache loaded successfully")
     except Exception as e:
         logger.error(f"Error loading cache: {e}")
         cache = {}
 
+def _write_atomic(path, data):
+    """Write bytes to a temporary file and move it over path"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 def save_cache():
-    """Save cache to file"""
+    """Save cache to file, skipping the write if nothing changed"""
+    global _last_saved_blob, _last_save_ts
+    _last_save_ts = time.monotonic()
     try:
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, ensure_ascii=False, indent=2)
+        with cache_lock:
+            data = msgpack.packb(cache, use_bin_type=True)
+            if data == _last_saved_blob:
+                logger.debug("Cache unchanged, skipping save")
+                return
+            _write_atomic(CACHE_FILE, data)
+            _last_saved_blob = data
         logger.info("Cache saved successfully")
     except Exception as e:
         logger.error(f"Error saving cache: {e}")
 
+def _deferred_save():
+    """Run the save scheduled by save_cache_debounced"""
+    global _save_pending
+    with _save_timer_lock:
+        # Stores from here on are not covered by this save and must re-arm the timer
+        _save_pending = False
+    save_cache()
+
+def save_cache_debounced():
+    """Save cache after a single-sign fetch, coalescing bursts of cache misses"""
+    global _save_timer, _save_pending
+    elapsed = time.monotonic() - _last_save_ts
+    if elapsed >= SAVE_DEBOUNCE_SECONDS:
+        save_cache()
+        return
+    # Saved recently; flush once the interval has passed instead of dropping the update
+    with _save_timer_lock:
+        if _save_pending:
+            return
+        _save_pending = True
+        _save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS - elapsed, _deferred_save)
+        _save_timer.daemon = True
+        _save_timer.start()
+
 def is_cache_valid(num):
     """Check if cache is still valid (same day)"""
-    today = datetime.now().strftime("%Y-%m-%d")
     return (str(num) in cache and 
             'date' in cache[str(num)] and 
-            cache[str(num)]['date'] == today)
+            cache[str(num)]['date'] == _today())
 
 def fetch_astro_data(num, force_update=False):
     """Fetch astrology data from source website"""
@@ -79,46 +229,143 @@ def fetch_astro_data(num, force_update=False):
         return cache[str(num)]
         
     try:
-        r = requests.get(f'http://astro.click108.com.tw/daily_{num}.php?iAstro={num}')
+        r = _session.get(SOURCE_URL.format(num=num), timeout=REQUEST_TIMEOUT)
         r.raise_for_status()
         
-        # Parse HTML
-        soup = BeautifulSoup(r.text, 'html.parser')
-        astro = soup.select("div.TODAY_CONTENT > h3")[0]
-        items = soup.select("div.TODAY_CONTENT > p")
-        
-        # Format data - Store both raw HTML response and structured data
-        result = {
-            "title": astro.text,
-            "items": [item.text for item in items],
-            "html": astro.text + "<br>" + "<br>".join([item.text + "<br>" for item in items]),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        # Update cache
-        cache[str(num)] = result
+        result = _build_result(r.content, r.headers)
+        _store_result(num, result)
         return result
     except Exception as e:
         logger.error(f"Error fetching astrology data: {e}")
         raise
 
+def _parse_page(content, headers):
+    """Parse raw page bytes, trusting a charset declared in the Content-Type header"""
+    parser = None
+    for param in headers.get('Content-Type', '').split(';')[1:]:
+        key, _, value = param.strip().partition('=')
+        charset = value.strip('"\' ')
+        if key.lower() == 'charset' and charset:
+            try:
+                parser = lxml_html.HTMLParser(encoding=charset)
+            except LookupError:
+                logger.warning(f"Unknown charset {charset!r}, detecting from the page instead")
+            break
+    # Without a usable header charset libxml2 detects it from the page's <meta> tag
+    return lxml_html.fromstring(content, parser=parser)
+
+def _build_result(content, headers):
+    """Parse a source page (raw bytes) into a cache entry"""
+    # Parse HTML
+    tree = _parse_page(content, headers)
+    astro_text = _XPATH_TITLE(tree)[0].text_content()
+    items_text = [node.text_content() for node in _XPATH_ITEMS(tree)]
+    
+    # Format data - Store both raw HTML response and structured data
+    result = {
+        "title": astro_text,
+        "items": items_text,
+        "html": "<br>".join([astro_text] + items_text),
+        "date": datetime.now().strftime("%Y-%m-%d"),
+        "timestamp": datetime.now().isoformat(),
+        # Validators used by needs_update for conditional HEAD requests
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified")
+    }
+    
+    # Precompute simplified versions once per update instead of per request
+    if OPENCC_AVAILABLE:
+        result["title_s"] = convert_to_simplified(result["title"])
+        result["items_s"] = [convert_to_simplified(item) for item in result["items"]]
+        result["html_s"] = convert_to_simplified(result["html"])
+    return result
+
+def _store_result(num, result):
+    """Update cache, publishing the response bodies before the entry itself"""
+    with cache_lock:
+        _prebuild(num, result)
+        cache[str(num)] = result
+
+def _process_one(num):
+    """Update a single astrology sign if needed, returning True if it was updated"""
+    if needs_update(num):
+        logger.info(f"Updating data for astrology sign {num}")
+        fetch_astro_data(num, force_update=True)
+        return True
+    logger.info(f"No updates needed for astrology sign {num}")
+    return False
+
 def fetch_all_astro_data():
     """Fetch data for all 12 astrology signs"""
     logger.info("Scheduled job: Fetching data for all astrology signs")
     updated = False
     
-    for num in range(12):  # 0-11 for the 12 signs
-        try:
-            # Check if current data is different from cached data
-            if needs_update(num):
-                logger.info(f"Updating data for astrology sign {num}")
-                fetch_astro_data(num, force_update=True)
-                updated = True
-            else:
-                logger.info(f"No updates needed for astrology sign {num}")
-        except Exception as e:
-            logger.error(f"Error updating astrology sign {num}: {e}")
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = {executor.submit(_process_one, num): num for num in range(12)}  # 0-11 for the 12 signs
+        for future in as_completed(futures):
+            num = futures[future]
+            try:
+                if future.result():
+                    updated = True
+            except Exception as e:
+                logger.error(f"Error updating astrology sign {num}: {e}")
+    
+    # Save cache if any updates were made
+    if updated:
+        logger.info("Updates found, saving cache")
+        save_cache()
+    else:
+        logger.info("No updates found for any astrology sign")
+
+def _update_check(num):
+    """Return (needs_request, headers) for checking a sign against the source"""
+    # If not in cache or not valid for today, fetch unconditionally
+    if not is_cache_valid(num):
+        return True, {}
+    
+    headers = {}
+    if cache[str(num)].get('etag'):
+        headers['If-None-Match'] = cache[str(num)]['etag']
+    if cache[str(num)].get('last_modified'):
+        headers['If-Modified-Since'] = cache[str(num)]['last_modified']
+    # Without validators the date check alone decides, and it says the entry is current
+    return bool(headers), headers
+
+async def _fetch_one_async(num, client):
+    """Fetch a single sign on the startup event loop, returning True if it was updated"""
+    needs_request, headers = _update_check(num)
+    if not needs_request:
+        logger.info(f"No updates needed for astrology sign {num}")
+        return False
+    
+    r = await client.get(SOURCE_URL.format(num=num), headers=headers)
+    if r.status_code == 304:
+        logger.info(f"No updates needed for astrology sign {num}")
+        return False
+    r.raise_for_status()
+    
+    # Parse off the event loop so the other downloads keep progressing
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, _build_result, r.content, r.headers)
+    _store_result(num, result)
+    logger.info(f"Updated data for astrology sign {num}")
+    return True
+
+async def _fetch_all_async():
+    """Fetch data for all 12 astrology signs concurrently at startup"""
+    limits = httpx.Limits(max_connections=12, max_keepalive_connections=12)
+    async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+        outcomes = await asyncio.gather(
+            *[_fetch_one_async(num, client) for num in range(12)],  # 0-11 for the 12 signs
+            return_exceptions=True
+        )
+    
+    updated = False
+    for num, outcome in enumerate(outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Error updating astrology sign {num}: {outcome}")
+        elif outcome:
+            updated = True
     
     # Save cache if any updates were made
     if updated:
@@ -130,26 +377,21 @@ def fetch_all_astro_data():
 def needs_update(num):
     """Check if the astrology data needs to be updated"""
     try:
-        # If not in cache or not valid for today, definitely needs update
-        if str(num) not in cache or not is_cache_valid(num):
+        needs_request, headers = _update_check(num)
+        if not needs_request:
+            return False
+        if not is_cache_valid(num):
+            # Not in cache or not valid for today, definitely needs update
             return True
-            
-        # Fetch current data without saving to cache
-        r = requests.get(f'http://astro.click108.com.tw/daily_{num}.php?iAstro={num}')
-        r.raise_for_status()
         
-        # Parse HTML
-        soup = BeautifulSoup(r.text, 'html.parser')
-        items = soup.select("div.TODAY_CONTENT > p")
-        current_items = [item.text for item in items]
+        # Ask the source whether the page changed since we cached it
+        r = _session.head(SOURCE_URL.format(num=num),
+                          headers=headers, timeout=REQUEST_TIMEOUT)
+        r.raise_for_status()
         
-        # Compare with cached items
-        if str(num) in cache and 'items' in cache[str(num)]:
-            cached_items = cache[str(num)]['items']
-            # Check if content has changed
-            if cached_items != current_items:
-                logger.info(f"Content changed for astrology {num}")
-                return True
+        if r.status_code != 304:
+            logger.info(f"Content changed for astrology {num}")
+            return True
                 
         return False
     except Exception as e:
@@ -157,31 +399,73 @@ def needs_update(num):
         # In case of error, assume update is needed
         return True
 
+def _seconds_until_next(*hours):
+    """Seconds from now until the next occurrence of any of the given hours"""
+    now = datetime.now()
+    # Ignore a boundary we are just past, so a timer that fires a hair early
+    # cannot run the same slot twice
+    earliest = now + timedelta(seconds=1)
+    today = [now.replace(hour=hour, minute=0, second=0, microsecond=0) for hour in hours]
+    # Also look two days ahead: just before midnight, tomorrow's 00:00 can fall
+    # inside the skipped second and the next slot is the day after
+    candidates = [slot + timedelta(days=days) for days in range(3) for slot in today]
+    return (min(c for c in candidates if c > earliest) - now).total_seconds()
+
+def _start_timer(name, delay, job):
+    """Start a daemon timer and remember it so setup_scheduler can cancel it"""
+    timer = threading.Timer(delay, job)
+    timer.daemon = True  # Don't block worker shutdown
+    _timers[name] = timer
+    timer.start()
+
+def _schedule_next(name, job, hours):
+    """Run job at the next of the given hours, then schedule it again"""
+    def _run_and_reschedule():
+        try:
+            job()
+        except Exception as e:
+            logger.error(f"Error running scheduled job {name}: {e}")
+        finally:
+            # Always reschedule so a single failure cannot end the chain
+            _schedule_next(name, job, hours)
+    
+    _start_timer(name, _seconds_until_next(*hours), _run_and_reschedule)
+
 def setup_scheduler():
     """Set up the scheduler for periodic data fetching"""
-    global scheduler
-    if scheduler:
-        scheduler.shutdown()
+    for timer in _timers.values():
+        timer.cancel()
+    _timers.clear()
     
-    scheduler = BackgroundScheduler()
     # Schedule jobs at 8:00 AM and 8:00 PM every day
-    scheduler.add_job(
-        fetch_all_astro_data, 
-        CronTrigger(hour='8,20'), 
-        id='fetch_astro_morning_evening'
-    )
+    _schedule_next('fetch_astro_morning_evening', fetch_all_astro_data, (8, 20))
     
     # Add a job that runs immediately when the app starts
-    scheduler.add_job(
-        fetch_all_astro_data, 
-        id='fetch_astro_startup'
-    )
+    _start_timer('fetch_astro_startup', 0, fetch_all_astro_data)
+    
+    # Free yesterday's responses and memoized conversions at midnight
+    _schedule_next('midnight_rollover', _midnight_rollover, (0,))
     
-    scheduler.start()
     logger.info("Scheduler started with jobs at 8:00 AM and 8:00 PM")
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which writes Chinese text as UTF-8 without escaping"""
+    def dumps(self, obj, **kwargs):
+        # Honour the same settings as the stdlib provider: sort_keys and the
+        # indent that response() passes when compact output is off
+        option = 0
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Create Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # 保留原有的路由和功能
 @app.route("/astro_api", methods=['GET'])
@@ -198,33 +482,32 @@ def astro_api():
     # 检查是否需要转换为简体中文
     convert_to_simple = request.args.get('convert', '').lower() in ['1', 'true', 'yes', 'y']
     
-    # 检查缓存
-    if is_cache_valid(num):
-        logger.info(f"Serving cached data for astrology {num}")
-        resp_data = cache[str(num)]["html"]
-    else:
-        logger.info(f"Fetching fresh data for astrology {num}")
-        try:
-            data = fetch_astro_data(num)
-            # Cache is updated within fetch_astro_data
-            save_cache()
-            resp_data = data["html"]
-        except Exception:
-            # 如果获取失败且缓存中存在该星座数据(即使不是今天的)，则使用缓存数据
-            if str(num) in cache:
-                logger.warning(f"Using outdated cache for astrology {num} due to fetch error")
-                resp_data = cache[str(num)]["html"]
-            else:
-                abort(500, "Failed to fetch astrology data")
-    
     # 如果需要，转换为简体中文
-    if convert_to_simple:
-        if OPENCC_AVAILABLE:
-            resp_data = convert_to_simplified(resp_data)
-        else:
-            logger.warning("Traditional to Simplified conversion requested but OpenCC not available")
+    variant = "simp" if convert_to_simple else "plain"
+    if convert_to_simple and not OPENCC_AVAILABLE:
+        logger.warning("Traditional to Simplified conversion requested but OpenCC not available")
+    
+    # 检查缓存: responses are rendered once per update in _prebuild
+    responses = _resp_cache[num]
+    if responses is not None and responses["date"] == _today():
+        return responses[variant]
     
-    return resp_data
+    logger.info(f"Fetching fresh data for astrology {num}")
+    try:
+        data = fetch_astro_data(num)
+        # Cache is updated within fetch_astro_data
+        save_cache_debounced()
+        responses = _resp_cache[num]
+        if responses is None or responses["date"] != data["date"]:
+            # Entry was already valid, so fetch_astro_data did not publish responses for it
+            _prebuild(num, data)
+        return _resp_cache[num][variant]
+    except Exception:
+        # 如果获取失败且缓存中存在该星座数据(即使不是今天的)，则使用缓存数据
+        if str(num) in cache:
+            logger.warning(f"Using outdated cache for astrology {num} due to fetch error")
+            return _build_responses(cache[str(num)])[variant]
+        abort(500, "Failed to fetch astrology data")
 
 # 新增API路由
 api_bp = Blueprint('api', __name__, url_prefix='/api')
@@ -248,7 +531,7 @@ def astro_json_api(num):
             try:
                 data = fetch_astro_data(num)
                 # Cache is updated within fetch_astro_data
-                save_cache()
+                save_cache_debounced()
             except Exception as e:
                 # 如果获取失败且缓存中存在该星座数据，则使用缓存数据
                 if str(num) in cache:
@@ -258,7 +541,15 @@ def astro_json_api(num):
                     return jsonify({"error": "Failed to fetch astrology data"}), 500
         
         # 如果需要，转换为简体中文
-        if convert_to_simple and OPENCC_AVAILABLE:
+        if convert_to_simple and "title_s" in data:
+            response_data = {
+                "title": data["title_s"],
+                "items": data["items_s"],
+                "date": data["date"],
+                "simplified": True
+            }
+        elif convert_to_simple and OPENCC_AVAILABLE:
+            # Entries loaded from an older cache file have no precomputed version
             response_data = {
                 "title": convert_to_simplified(data["title"]),
                 "items": [convert_to_simplified(item) for item in data["items"]],
@@ -291,6 +582,14 @@ def manual_update():
         logger.error(f"Error triggering data update: {e}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
+# Add route to inspect the binary cache file while debugging
+@api_bp.route("/cache.json", methods=['GET'])
+def cache_json_export():
+    """Endpoint to export the current cache as JSON"""
+    with cache_lock:
+        snapshot = dict(cache)
+    return jsonify(snapshot)
+
 # Register blueprint
 app.register_blueprint(api_bp)
 
@@ -302,7 +601,7 @@ def create_app():
     # Fetch all astrology data immediately
     logger.info("Application startup: Fetching all astrology data")
     try:
-        fetch_all_astro_data()  # Synchronously fetch data at startup
+        asyncio.run(_fetch_all_async())  # Fetch all signs concurrently before serving
     except Exception as e:
         logger.error(f"Error fetching astrology data at startup: {e}")
     
@@ -317,7 +616,7 @@ if __name__ == "__main__":
     # Fetch all astrology data immediately
     logger.info("Application startup: Fetching all astrology data")
     try:
-        fetch_all_astro_data()  # Synchronously fetch data at startup
+        asyncio.run(_fetch_all_async())  # Fetch all signs concurrently before serving
     except Exception as e:
         logger.error(f"Error fetching astrology data at startup: {e}")
     
@@ -7,9 +7,14 @@ This can be used independently of the Flask application.
 import os
 import sys
 import json
+import tempfile
+import msgpack
 import logging
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter, Retry
+from lxml import html as lxml_html
+from lxml.etree import XPath
 from datetime import datetime
 
 # Configure logging
@@ -18,48 +23,103 @@ logger = logging.getLogger(__name__)
 
 # Cache file location
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-CACHE_FILE = os.path.join(SCRIPT_DIR, "astro_cache.json")
+CACHE_FILE = os.path.join(SCRIPT_DIR, "astro_cache.msgpack")
+# JSON cache written by older versions, migrated on the next save
+LEGACY_CACHE_FILE = os.path.join(SCRIPT_DIR, "astro_cache.json")
+
+# Selectors for the daily reading, compiled once at import time. They match
+# "div.TODAY_CONTENT > h3" and "div.TODAY_CONTENT > p".
+_TODAY_CONTENT = 'div[contains(concat(" ", normalize-space(@class), " "), " TODAY_CONTENT ")]'
+_XPATH_TITLE = XPath(f'//{_TODAY_CONTENT}/h3')
+_XPATH_ITEMS = XPath(f'//{_TODAY_CONTENT}/p')
+
+# Number of signs fetched concurrently by update_all_astro_data
+FETCH_WORKERS = 6
+
+# Shared HTTP session so consecutive fetches reuse keep-alive connections
+REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
 
 def load_cache():
     """Load cache from file if exists"""
     try:
         if os.path.exists(CACHE_FILE):
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            with open(CACHE_FILE, 'rb') as f:
+                cache = msgpack.unpackb(f.read(), raw=False)
+        elif os.path.exists(LEGACY_CACHE_FILE):
+            with open(LEGACY_CACHE_FILE, 'r', encoding='utf-8') as f:
                 cache = json.load(f)
-            logger.info("Cache loaded successfully")
-            return cache
-        return {}
+        else:
+            return {}
+        logger.info("Cache loaded successfully")
+        return cache
     except Exception as e:
         logger.error(f"Error loading cache: {e}")
         return {}
 
+def _write_atomic(path, data):
+    """Write bytes to a temporary file and move it over path"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 def save_cache(cache):
     """Save cache to file"""
     try:
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, ensure_ascii=False, indent=2)
+        data = msgpack.packb(cache, use_bin_type=True)
+        _write_atomic(CACHE_FILE, data)
         logger.info("Cache saved successfully")
     except Exception as e:
         logger.error(f"Error saving cache: {e}")
 
+def _parse_page(content, headers):
+    """Parse raw page bytes, trusting a charset declared in the Content-Type header"""
+    parser = None
+    for param in headers.get('Content-Type', '').split(';')[1:]:
+        key, _, value = param.strip().partition('=')
+        charset = value.strip('"\' ')
+        if key.lower() == 'charset' and charset:
+            try:
+                parser = lxml_html.HTMLParser(encoding=charset)
+            except LookupError:
+                logger.warning(f"Unknown charset {charset!r}, detecting from the page instead")
+            break
+    # Without a usable header charset libxml2 detects it from the page's <meta> tag
+    return lxml_html.fromstring(content, parser=parser)
+
 def fetch_astro_data(num, cache):
     """Fetch astrology data for a specific sign"""
     try:
-        r = requests.get(f'http://astro.click108.com.tw/daily_{num}.php?iAstro={num}')
+        r = _session.get(f'http://astro.click108.com.tw/daily_{num}.php?iAstro={num}', timeout=REQUEST_TIMEOUT)
         r.raise_for_status()
         
         # Parse HTML
-        soup = BeautifulSoup(r.text, 'html.parser')
-        astro = soup.select("div.TODAY_CONTENT > h3")[0]
-        items = soup.select("div.TODAY_CONTENT > p")
+        tree = _parse_page(r.content, r.headers)
+        astro_text = _XPATH_TITLE(tree)[0].text_content()
+        items_text = [node.text_content() for node in _XPATH_ITEMS(tree)]
         
         # Format data - Store both raw HTML response and structured data
         result = {
-            "title": astro.text,
-            "items": [item.text for item in items],
-            "html": astro.text + "<br>" + "<br>".join([item.text + "<br>" for item in items]),
+            "title": astro_text,
+            "items": items_text,
+            "html": "<br>".join([astro_text] + items_text),
             "date": datetime.now().strftime("%Y-%m-%d"),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat(),
+            # Validators used by needs_update for conditional HEAD requests
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified")
         }
         
         return result
@@ -76,22 +136,23 @@ def needs_update(num, cache):
         return True
         
     try:
-        # Fetch current data to compare
-        r = requests.get(f'http://astro.click108.com.tw/daily_{num}.php?iAstro={num}')
-        r.raise_for_status()
+        # Ask the source whether the page changed since we cached it
+        headers = {}
+        if cache[str(num)].get('etag'):
+            headers['If-None-Match'] = cache[str(num)]['etag']
+        if cache[str(num)].get('last_modified'):
+            headers['If-Modified-Since'] = cache[str(num)]['last_modified']
+        if not headers:
+            # No validators cached, so the date check above is all we have
+            return False
         
-        # Parse HTML
-        soup = BeautifulSoup(r.text, 'html.parser')
-        items = soup.select("div.TODAY_CONTENT > p")
-        current_items = [item.text for item in items]
+        r = _session.head(f'http://astro.click108.com.tw/daily_{num}.php?iAstro={num}',
+                          headers=headers, timeout=REQUEST_TIMEOUT)
+        r.raise_for_status()
         
-        # Compare with cached items
-        if 'items' in cache[str(num)]:
-            cached_items = cache[str(num)]['items']
-            # Check if content has changed
-            if cached_items != current_items:
-                logger.info(f"Content changed for astrology {num}")
-                return True
+        if r.status_code != 304:
+            logger.info(f"Content changed for astrology {num}")
+            return True
                 
         return False
     except Exception as e:
@@ -99,25 +160,32 @@ def needs_update(num, cache):
         # In case of error, assume update is needed
         return True
 
+def _process_one(num, cache):
+    """Fetch data for a single sign if needed, returning None when unchanged"""
+    if needs_update(num, cache):
+        logger.info(f"Updating data for astrology sign {num}")
+        return fetch_astro_data(num, cache)
+    logger.info(f"No update needed for astrology sign {num}")
+    return None
+
 def update_all_astro_data():
     """Update data for all 12 astrology signs"""
     logger.info("Starting update for all astrology signs")
     cache = load_cache()
     updated = False
     
-    for num in range(12):  # 0-11 for the 12 signs
-        try:
-            # Check if needs update
-            if needs_update(num, cache):
-                logger.info(f"Updating data for astrology sign {num}")
-                data = fetch_astro_data(num, cache)
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = {executor.submit(_process_one, num, cache): num for num in range(12)}  # 0-11 for the 12 signs
+        for future in as_completed(futures):
+            num = futures[future]
+            try:
+                data = future.result()
                 if data:
+                    # Results are merged here, on the main thread only
                     cache[str(num)] = data
                     updated = True
-            else:
-                logger.info(f"No update needed for astrology sign {num}")
-        except Exception as e:
-            logger.error(f"Error processing astrology sign {num}: {e}")
+            except Exception as e:
+                logger.error(f"Error processing astrology sign {num}: {e}")
     
     # Save cache if any updates were made
     if updated:
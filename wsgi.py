@@ -1,7 +1,10 @@
+# Patch blocking socket I/O before anything else imports it, so gevent workers
+# can yield while waiting on the source site
+from gevent import monkey
+monkey.patch_all()
+
 from astro_api import create_app
 
-# This is the application object that WSGI servers (like Gunicorn) use
+# This is the application object that WSGI servers (like Gunicorn) use:
+#   gunicorn -k gevent -w 4 --worker-connections 1000 --bind=0.0.0.0:5000 wsgi:app
 app = create_app()
-
-if __name__ == "__main__":
-    app.run()